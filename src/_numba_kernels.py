@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""JIT-compiled numeric kernels for Kalshi trading bot hot loops."""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run kernels as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def spread_zscores(histories):
+    """
+    Latest-point spread z-scores for every pair of equal-length price series.
+
+    Mirrors StatisticalArbitrageAnalyzer.calculate_spread: each row is
+    standardized (constant rows are only centred), the spread of a pair is
+    the difference of the standardized rows, and the z-score is that of the
+    last spread value against the whole spread.
+
+    Args:
+        histories: float64 array of shape (n_markets, n_points)
+
+    Returns:
+        (n_markets, n_markets) array; entry [i, j] for i < j holds the z-score
+    """
+    n_markets, n_points = histories.shape
+    normalized = np.empty((n_markets, n_points))
+
+    for row in range(n_markets):
+        mean = 0.0
+        for k in range(n_points):
+            mean += histories[row, k]
+        mean /= n_points
+
+        var = 0.0
+        for k in range(n_points):
+            diff = histories[row, k] - mean
+            var += diff * diff
+        std = np.sqrt(var / n_points)
+        if std == 0.0:
+            std = 1.0
+
+        for k in range(n_points):
+            normalized[row, k] = (histories[row, k] - mean) / std
+
+    z_scores = np.zeros((n_markets, n_markets))
+    last = n_points - 1
+
+    for i in range(n_markets):
+        for j in range(i + 1, n_markets):
+            mean = 0.0
+            for k in range(n_points):
+                mean += normalized[i, k] - normalized[j, k]
+            mean /= n_points
+
+            var = 0.0
+            for k in range(n_points):
+                diff = normalized[i, k] - normalized[j, k] - mean
+                var += diff * diff
+            std = np.sqrt(var / n_points)
+
+            if std > 0.0:
+                z_scores[i, j] = (normalized[i, last] - normalized[j, last] - mean) / std
+
+    return z_scores
+
+
+# Per-token lexicon flags used by score_token_batch
+TOKEN_KNOWN = 1
+TOKEN_MODIFIER = 2
+TOKEN_NEGATION = 4
+TOKEN_LY = 8
+TOKEN_MOOD = 16
+
+# Per-occurrence flags used by score_token_batch
+OCCURRENCE_BANG = 1
+OCCURRENCE_LONGER_THAN_1 = 2
+OCCURRENCE_LONGER_THAN_2 = 4
+
+
+@njit(cache=True)
+def _clip_unit(value):
+    return max(-1.0, min(value, 1.0))
+
+
+@njit(cache=True)
+def score_token_batch(token_ids, occurrence_flags, offsets, polarity, subjectivity,
+                      intensity, token_flags):
+    """
+    Lexicon polarity and subjectivity for a batch of tokenized texts.
+
+    A port of TextBlob's pattern sentiment assessments for untagged text.
+    Known words are scored alone or merged into the chunk of a preceding
+    modifier ("very good"). A negation flips the chunk ("not good" counts
+    -0.5 times its polarity) and carries across one-letter words. "!"
+    boosts the previous chunk, and mood emoticons score on their own. Each
+    text scores the mean over its chunks.
+
+    Texts are stored back to back in `token_ids`, with text d spanning
+    token_ids[offsets[d]:offsets[d + 1]]. Token id 0 is an unknown word.
+
+    Args:
+        token_ids: int32 token ids for all texts
+        occurrence_flags: int8 OCCURRENCE_* bits per token occurrence
+        offsets: int64 start offsets, one per text plus a final end offset
+        polarity: float64 polarity per token id
+        subjectivity: float64 subjectivity per token id
+        intensity: float64 modifier intensity per token id
+        token_flags: int8 TOKEN_* bits per token id
+
+    Returns:
+        (n_texts, 2) float64 array of polarity and subjectivity per text
+        (0.0 for both if a text has no scored chunks)
+    """
+    n_texts = len(offsets) - 1
+    scores = np.zeros((n_texts, 2))
+    max_chunks = 0
+    for text in range(n_texts):
+        max_chunks = max(max_chunks, offsets[text + 1] - offsets[text])
+    chunk_p = np.empty(max_chunks)
+    chunk_s = np.empty(max_chunks)
+    chunk_i = np.empty(max_chunks)
+    chunk_negated = np.empty(max_chunks, dtype=np.bool_)
+
+    for text in range(n_texts):
+        chunks = 0
+        modifier = False
+        modifier_ly = False
+        negation = False
+
+        for k in range(offsets[text], offsets[text + 1]):
+            token = token_ids[k]
+            flags = token_flags[token]
+            occurrence = occurrence_flags[k]
+
+            if flags & TOKEN_KNOWN:
+                if not modifier:
+                    chunk_p[chunks] = polarity[token]
+                    chunk_s[chunks] = subjectivity[token]
+                    chunk_i[chunks] = intensity[token]
+                    chunk_negated[chunks] = False
+                    chunks += 1
+                else:
+                    last = chunks - 1
+                    chunk_p[last] = _clip_unit(polarity[token] * chunk_i[last])
+                    chunk_s[last] = _clip_unit(subjectivity[token] * chunk_i[last])
+                    chunk_i[last] = intensity[token]
+                if negation:
+                    chunk_i[chunks - 1] = 1.0 / chunk_i[chunks - 1]
+                    chunk_negated[chunks - 1] = True
+
+                modifier = (flags & TOKEN_MODIFIER) != 0
+                modifier_ly = (flags & TOKEN_LY) != 0
+                negation = (flags & TOKEN_NEGATION) != 0
+            else:
+                if flags & TOKEN_NEGATION:
+                    negation = True
+                elif negation and occurrence & OCCURRENCE_LONGER_THAN_1:
+                    negation = False
+
+                if negation and modifier and modifier_ly:
+                    chunk_negated[chunks - 1] = True
+                    negation = False
+                elif modifier and occurrence & OCCURRENCE_LONGER_THAN_2:
+                    modifier = False
+
+                if occurrence & OCCURRENCE_BANG and chunks > 0:
+                    chunk_p[chunks - 1] = _clip_unit(chunk_p[chunks - 1] * 1.25)
+
+                if flags & TOKEN_MOOD:
+                    chunk_p[chunks] = polarity[token]
+                    chunk_s[chunks] = 1.0
+                    chunk_i[chunks] = 1.0
+                    chunk_negated[chunks] = False
+                    chunks += 1
+
+        if chunks > 0:
+            total_p = 0.0
+            total_s = 0.0
+            for c in range(chunks):
+                total_p += -0.5 * chunk_p[c] if chunk_negated[c] else chunk_p[c]
+                total_s += chunk_s[c]
+            scores[text, 0] = total_p / chunks
+            scores[text, 1] = total_s / chunks
+
+    return scores
+
+
+@njit(cache=True, fastmath=True)
+def kelly_sizes(p, b, fraction, cap):
+    """
+    Fractional Kelly bet sizes for a batch of markets.
+
+    Each size is the Kelly optimum f* = (b*p - q) / b with q = 1 - p, scaled
+    by `fraction` (0.5 for half-Kelly) and clipped to [0, cap]. Markets with
+    no edge or non-positive odds get 0.
+
+    Args:
+        p: float64 win probabilities
+        b: float64 net odds (payout per unit staked on a win)
+        fraction: Kelly multiplier
+        cap: Maximum fraction of bankroll per market
+
+    Returns:
+        float64 array of bankroll fractions, one per market
+    """
+    n = len(p)
+    sizes = np.zeros(n)
+
+    for k in range(n):
+        if b[k] <= 0.0:
+            continue
+        size = fraction * (b[k] * p[k] - (1.0 - p[k])) / b[k]
+        if size > cap:
+            size = cap
+        if size > 0.0:
+            sizes[k] = size
+
+    return sizes
@@ -3,16 +3,20 @@
 
 import logging
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
 from statsmodels.tsa.stattools import coint, adfuller
 from statsmodels.tsa.vector_ar import vecm
 from scipy import stats
 from sklearn.preprocessing import StandardScaler
+from collections import defaultdict
 from config import STAT_ARBITRAGE_THRESHOLD
+from _numba_kernels import spread_zscores
 
 logger = logging.getLogger(__name__)
 
+# Slack for float differences between the screening kernel and calculate_spread
+SCREEN_TOLERANCE = 1e-6
+
 class StatisticalArbitrageAnalyzer:
     """Analyzes statistical relationships between Kalshi markets for arbitrage opportunities."""
 
@@ -191,6 +195,44 @@ class StatisticalArbitrageAnalyzer:
             }
         }
 
+    def screen_pair_candidates(self, markets_data: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Flag market pairs whose latest spread z-score can clear the threshold.
+
+        Markets are grouped by history length and each group is stacked into a
+        single 2-D array so the pairwise z-scores come from one compiled pass.
+        Pairs that cannot be screened (different lengths, non-numeric history)
+        stay flagged and fall through to the full analysis.
+
+        Args:
+            markets_data: List of market data dictionaries
+
+        Returns:
+            (n, n) boolean array; entry [i, j] for i < j is True if the pair
+            should be analyzed
+        """
+        n_markets = len(markets_data)
+        candidates = np.ones((n_markets, n_markets), dtype=bool)
+
+        groups = defaultdict(list)
+        for idx, market in enumerate(markets_data):
+            groups[len(market.get('price_history', []))].append(idx)
+
+        for indices in groups.values():
+            if len(indices) < 2:
+                continue
+            try:
+                histories = np.array([markets_data[idx]['price_history'] for idx in indices],
+                                     dtype=np.float64)
+            except (TypeError, ValueError):
+                continue
+
+            z_scores = spread_zscores(histories)
+            rows = np.array(indices)
+            candidates[np.ix_(rows, rows)] = np.abs(z_scores) > STAT_ARBITRAGE_THRESHOLD - SCREEN_TOLERANCE
+
+        return candidates
+
     def find_arbitrage_opportunities(self, markets_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Scan all markets for arbitrage opportunities.
@@ -211,9 +253,16 @@ class StatisticalArbitrageAnalyzer:
 
         logger.info(f"Analyzing {len(eligible_markets)} markets for arbitrage opportunities")
 
+        # A pair can only signal if its spread z-score clears the threshold, so
+        # screen all pairs at once and skip cointegration tests that cannot pay off
+        candidates = self.screen_pair_candidates(eligible_markets)
+
         # Compare each pair of markets (this is O(n²) but fine for Kalshi's scale)
         for i, market1 in enumerate(eligible_markets):
-            for market2 in eligible_markets[i+1:]:
+            for j in range(i + 1, len(eligible_markets)):
+                if not candidates[i, j]:
+                    continue
+                market2 = eligible_markets[j]
                 try:
                     analysis = self.analyze_market_pair(market1, market2)
 
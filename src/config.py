@@ -25,10 +25,13 @@ LOG_LEVEL = "INFO"
 # Error handling settings
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 5
+REQUEST_TIMEOUT_SECONDS = 10
 
 # Notification settings
 ENABLE_NOTIFICATIONS = True
 NOTIFICATION_THRESHOLD = 0.05  # Notify if profit/loss exceeds this percentage
+NOTIFICATION_BATCH_SIZE = 20   # Flush queued trade notifications once this many are pending
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096  # Telegram sendMessage text limit
 
 # Advanced Strategy Parameters
 NEWS_SENTIMENT_THRESHOLD = 0.6  # Threshold for positive sentiment to trigger a trade
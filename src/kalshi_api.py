@@ -1,13 +1,17 @@
 import logging
 import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import (
     KALSHI_API_KEY,
     KALSHI_API_BASE_URL,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
+    REQUEST_TIMEOUT_SECONDS,
 )
+from utils import validate_api_key
 
 class KalshiAPI:
     def __init__(
@@ -16,28 +20,48 @@ class KalshiAPI:
         base_url=None,
         max_retries=MAX_RETRIES,
         retry_delay=RETRY_DELAY_SECONDS,
+        timeout=REQUEST_TIMEOUT_SECONDS,
     ):
         self.api_key = api_key or KALSHI_API_KEY
+        # The key is fixed for the client's lifetime, so check it once here
+        validate_api_key(self.api_key)
         self.base_url = base_url or KALSHI_API_BASE_URL
         self.logger = logging.getLogger(__name__)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.timeout = timeout
+
+        # One pooled session so repeated polls reuse the TCP/TLS connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        })
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _handle_request(self, method, endpoint, **kwargs):
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        kwargs.setdefault("timeout", self.timeout)
         attempt = 0
         backoff = self.retry_delay
 
         while attempt < self.max_retries:
             try:
-                response = requests.request(method, url, headers=headers, **kwargs)
+                response = self._session.request(method, url, **kwargs)
                 response.raise_for_status()
                 if response.content:
-                    return response.json()
+                    return orjson.loads(response.content)
                 return {}
             except requests.exceptions.HTTPError as http_err:
                 status_code = getattr(http_err.response, "status_code", None)
@@ -50,7 +74,7 @@ class KalshiAPI:
                     f"HTTP error ({status_code}) on attempt {attempt + 1}/{self.max_retries} "
                     f"for {endpoint}: {http_err}. Retrying in {backoff}s."
                 )
-            except requests.exceptions.RequestException as req_err:
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as req_err:
                 self.logger.warning(
                     f"Request exception on attempt {attempt + 1}/{self.max_retries} "
                     f"for {endpoint}: {req_err}. Retrying in {backoff}s."
@@ -96,7 +120,7 @@ class KalshiAPI:
         return self._handle_request("GET", "/portfolio/orders", params=params or {})
 
     def create_order(self, order_payload):
-        return self._handle_request("POST", "/portfolio/orders", json=order_payload)
+        return self._handle_request("POST", "/portfolio/orders", data=orjson.dumps(order_payload))
 
     def cancel_order(self, order_id):
         return self._handle_request("DELETE", f"/portfolio/orders/{order_id}")
@@ -23,20 +23,23 @@ class Logger:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
 
-    def debug(self, message):
-        self.logger.debug(message)
+    def isEnabledFor(self, level):
+        return self.logger.isEnabledFor(level)
 
-    def info(self, message):
-        self.logger.info(message)
+    def debug(self, message, *args):
+        self.logger.debug(message, *args)
 
-    def warning(self, message):
-        self.logger.warning(message)
+    def info(self, message, *args):
+        self.logger.info(message, *args)
 
-    def error(self, message):
-        self.logger.error(message)
+    def warning(self, message, *args):
+        self.logger.warning(message, *args)
 
-    def critical(self, message):
-        self.logger.critical(message)
+    def error(self, message, *args):
+        self.logger.error(message, *args)
+
+    def critical(self, message, *args):
+        self.logger.critical(message, *args)
 
     def log_trade(self, trade_info):
         self.logger.info(f'Trade executed: {trade_info}')
@@ -1,4 +1,4 @@
-import time
+import asyncio
 import logging
 from config import KALSHI_API_KEY, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, BANKROLL, TRADE_INTERVAL_SECONDS
 from kalshi_api import KalshiAPI
@@ -11,7 +11,7 @@ def setup_logging():
     logger = Logger()
     return logger
 
-def main():
+async def main():
     logger = setup_logging()
     logger.info("Starting Kalshi Advanced Trading Bot with Phase 3 features")
     notifier = None
@@ -28,10 +28,10 @@ def main():
 
         while True:
             logger.info("Running trading strategy with real-time market data")
-            trader.run_trading_strategy()
-            time.sleep(TRADE_INTERVAL_SECONDS)
+            await trader.run_trading_strategy_async()
+            await asyncio.sleep(TRADE_INTERVAL_SECONDS)
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Bot shutdown requested by user")
         if trader:
             trader.market_data_streamer.stop_streaming()
@@ -48,4 +48,7 @@ def main():
             logger.info("Market data streaming stopped")
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -7,7 +7,19 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from textblob import TextBlob
 import re
+import numpy as np
 from config import NEWS_API_KEY, NEWS_API_BASE_URL
+from _numba_kernels import (
+    score_token_batch,
+    TOKEN_KNOWN,
+    TOKEN_MODIFIER,
+    TOKEN_NEGATION,
+    TOKEN_LY,
+    TOKEN_MOOD,
+    OCCURRENCE_BANG,
+    OCCURRENCE_LONGER_THAN_1,
+    OCCURRENCE_LONGER_THAN_2,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +40,12 @@ class NewsSentimentAnalyzer:
             'market', 'stock', 'trading', 'finance', 'economic'
         ]
 
+        # Token lookup tables for batch lexicon scoring, built on first use
+        self._vocabulary: Optional[Dict[str, int]] = None
+        self._lexicon_scores: Optional[tuple] = None
+        self._token_flags: Optional[np.ndarray] = None
+        self._tokenize = None
+
     def fetch_news(self, query: str = None, days_back: int = 1) -> List[Dict[str, Any]]:
         """
         Fetch news articles from NewsAPI.
@@ -92,6 +110,97 @@ class NewsSentimentAnalyzer:
             logger.error(f"Error analyzing sentiment: {e}")
             return {'polarity': 0.0, 'subjectivity': 0.5}
 
+    def _build_lexicon_tables(self):
+        """
+        Build token id, score and flag tables from TextBlob's sentiment lexicon.
+        """
+        from textblob.en import sentiment as lexicon
+        from textblob._text import EMOTICONS, PUNCTUATION
+
+        # Mood emoticons TextBlob can match on lowercased tokens
+        moods = {}
+        for (_, mood_polarity), emoticons in EMOTICONS.items():
+            for emoticon in emoticons:
+                emoticon = emoticon.lower()
+                if not emoticon.isalpha() and len(emoticon) <= 5 and emoticon not in PUNCTUATION:
+                    moods.setdefault(emoticon, mood_polarity)
+
+        # Id 0 is reserved for unknown words
+        words = list(dict.fromkeys(list(lexicon.keys()) + list(lexicon.negations) + list(moods)))
+        self._vocabulary = {word: idx for idx, word in enumerate(words, start=1)}
+
+        size = len(words) + 1
+        polarity = np.zeros(size)
+        subjectivity = np.zeros(size)
+        intensity = np.ones(size)
+        flags = np.zeros(size, dtype=np.int8)
+
+        for word, idx in self._vocabulary.items():
+            if word in lexicon and None in lexicon[word]:
+                polarity[idx], subjectivity[idx], intensity[idx] = lexicon[word][None]
+                flags[idx] |= TOKEN_KNOWN
+                if any(tag in lexicon[word] for tag in lexicon.modifiers):
+                    flags[idx] |= TOKEN_MODIFIER
+            elif word in moods:
+                polarity[idx] = moods[word]
+                flags[idx] |= TOKEN_MOOD
+            if word in lexicon.negations:
+                flags[idx] |= TOKEN_NEGATION
+            if lexicon.modifier(word):
+                flags[idx] |= TOKEN_LY
+
+        self._lexicon_scores = (polarity, subjectivity, intensity)
+        self._token_flags = flags
+        self._tokenize = lexicon.tokenizer
+
+    def _score_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Polarity and subjectivity for already preprocessed texts.
+
+        Args:
+            texts: Preprocessed texts to score
+
+        Returns:
+            (len(texts), 2) array of polarity (-1 to 1) and subjectivity (0 to 1)
+        """
+        if self._vocabulary is None:
+            self._build_lexicon_tables()
+
+        vocabulary = self._vocabulary
+        token_ids = []
+        occurrence_flags = []
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        for idx, text in enumerate(texts):
+            for token in " ".join(self._tokenize(text)).split():
+                token = token.lower()
+                token_ids.append(vocabulary.get(token, 0))
+                occurrence_flags.append(
+                    (OCCURRENCE_BANG if token == "!" else 0)
+                    | (OCCURRENCE_LONGER_THAN_1 if len(token.strip("'")) > 1 else 0)
+                    | (OCCURRENCE_LONGER_THAN_2 if len(token) > 2 else 0)
+                )
+            offsets[idx + 1] = len(token_ids)
+
+        polarity, subjectivity, intensity = self._lexicon_scores
+        return score_token_batch(np.array(token_ids, dtype=np.int32),
+                                 np.array(occurrence_flags, dtype=np.int8), offsets,
+                                 polarity, subjectivity, intensity, self._token_flags)
+
+    def score_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Score many texts at once with a compiled lexicon kernel.
+
+        Gives the same polarity as analyze_sentiment on the preprocessed text,
+        without building a TextBlob per text.
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Array of polarity scores from -1 to 1, one per text
+        """
+        return self._score_batch([self.preprocess_text(text) for text in texts])[:, 0]
+
     def preprocess_text(self, text: str) -> str:
         """
         Preprocess text for better sentiment analysis.
@@ -136,34 +245,15 @@ class NewsSentimentAnalyzer:
                 'neutral_articles': 0
             }
 
-        sentiments = []
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-
+        # Combine title and description for analysis
+        clean_texts = []
         for article in articles:
-            title = article.get('title', '')
-            description = article.get('description', '')
-            content = article.get('content', '')
-
-            # Combine title and description for analysis
-            text = f"{title} {description}".strip()
+            text = f"{article.get('title', '')} {article.get('description', '')}".strip()
             clean_text = self.preprocess_text(text)
-
             if clean_text:
-                sentiment = self.analyze_sentiment(clean_text)
-                sentiments.append(sentiment)
-
-                # Classify sentiment
-                polarity = sentiment['polarity']
-                if polarity > 0.1:
-                    positive_count += 1
-                elif polarity < -0.1:
-                    negative_count += 1
-                else:
-                    neutral_count += 1
-
-        if not sentiments:
+                clean_texts.append(clean_text)
+
+        if not clean_texts:
             return {
                 'overall_sentiment': 0.0,
                 'confidence': 0.0,
@@ -173,21 +263,30 @@ class NewsSentimentAnalyzer:
                 'neutral_articles': 0
             }
 
+        # Score all articles in one batch
+        scores = self._score_batch(clean_texts)
+        polarities = scores[:, 0]
+
+        # Classify sentiment
+        positive_count = int((polarities > 0.1).sum())
+        negative_count = int((polarities < -0.1).sum())
+        neutral_count = len(clean_texts) - positive_count - negative_count
+
         # Calculate aggregate metrics
-        avg_polarity = sum(s['polarity'] for s in sentiments) / len(sentiments)
-        avg_subjectivity = sum(s['subjectivity'] for s in sentiments) / len(sentiments)
+        avg_polarity = float(polarities.mean())
+        avg_subjectivity = float(scores[:, 1].mean())
 
         # Confidence based on agreement and article count
-        polarity_variance = sum((s['polarity'] - avg_polarity) ** 2 for s in sentiments) / len(sentiments)
+        polarity_variance = float(((polarities - avg_polarity) ** 2).mean())
         agreement_factor = 1 / (1 + polarity_variance)  # Higher agreement = higher confidence
-        volume_factor = min(len(sentiments) / 10, 1.0)  # More articles = higher confidence
+        volume_factor = min(len(clean_texts) / 10, 1.0)  # More articles = higher confidence
         confidence = agreement_factor * volume_factor
 
         return {
             'overall_sentiment': round(avg_polarity, 3),
             'avg_subjectivity': round(avg_subjectivity, 3),
             'confidence': round(confidence, 3),
-            'article_count': len(sentiments),
+            'article_count': len(clean_texts),
             'positive_articles': positive_count,
             'negative_articles': negative_count,
             'neutral_articles': neutral_count,
@@ -1,6 +1,9 @@
+import orjson
 import requests
 import logging
-from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
+from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_MAX_MESSAGE_LENGTH
+
+TRADE_PREFIX = "🔔 Trade: "
 
 class Notifier:
     def __init__(self, bot_token=None, chat_id=None):
@@ -16,7 +19,8 @@ class Notifier:
                 'text': message,
                 'parse_mode': 'Markdown'
             }
-            response = requests.post(self.base_url, json=payload)
+            response = requests.post(self.base_url, data=orjson.dumps(payload),
+                                     headers={'Content-Type': 'application/json'})
             response.raise_for_status()
             logging.info("Message sent successfully: %s", message)
         except requests.exceptions.HTTPError as http_err:
@@ -26,7 +30,30 @@ class Notifier:
 
     def send_trade_notification(self, message):
         """Send trade notification"""
-        self.send_message(f"🔔 Trade: {message}")
+        self.send_message(f"{TRADE_PREFIX}{message}")
+
+    def send_trade_notifications(self, messages):
+        """Send several trade notifications packed into as few messages as Telegram allows"""
+        # Split any message too long to go out on its own into pieces that fit
+        limit = TELEGRAM_MAX_MESSAGE_LENGTH - len(TRADE_PREFIX)
+        pieces = [message[start:start + limit]
+                  for message in messages
+                  for start in range(0, max(len(message), 1), limit)]
+
+        chunk = []
+        length = len(TRADE_PREFIX)
+        for message in pieces:
+            added = len(message) + (1 if chunk else 0)
+            if chunk and length + added > TELEGRAM_MAX_MESSAGE_LENGTH:
+                self.send_trade_notification("\n".join(chunk))
+                chunk = []
+                length = len(TRADE_PREFIX)
+                added = len(message)
+            chunk.append(message)
+            length += added
+
+        if chunk:
+            self.send_trade_notification("\n".join(chunk))
 
     def send_error_notification(self, error_message):
         """Send error notification"""
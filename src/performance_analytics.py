@@ -6,7 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
@@ -73,10 +73,21 @@ class PerformanceAnalytics:
         logger.info(f"Recorded trade: {trade.strategy} {trade.side} {trade.quantity} "
                    f"units of {trade.market_id} at ${trade.entry_price:.2f}")
 
-    def close_trade(self, trade_id: str, exit_price: float, exit_reason: str = 'manual'):
-        """Close an existing trade."""
+    def close_trade(self, trade_id: str, exit_price: float, exit_reason: str = 'manual',
+                    quantity: Optional[int] = None):
+        """
+        Close an existing trade.
+
+        When quantity is less than the trade's open quantity, only that part
+        is closed: it is split off into its own closed record and the rest
+        of the trade stays open.
+        """
         for trade in self.trades:
             if trade.trade_id == trade_id and not trade.is_closed:
+                if quantity is not None and quantity < trade.quantity:
+                    trade.quantity -= quantity
+                    trade = replace(trade, quantity=quantity)
+                    self.trades.append(trade)
                 trade.close_trade(exit_price, exit_reason)
 
                 # Update daily P&L
@@ -90,39 +101,33 @@ class PerformanceAnalytics:
         return False
 
     def get_trade_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive trade statistics."""
+        """
+        Get comprehensive trade statistics.
+
+        A trade closed in parts has one record per closed part, all sharing
+        its trade_id. Trade counts are by distinct trade_id, with a trade
+        open until every part is closed; P&L metrics are over the closed
+        records.
+        """
         if not self.trades:
             return {'total_trades': 0}
 
         closed_trades = [t for t in self.trades if t.is_closed]
+        total_trades = len({t.trade_id for t in self.trades})
+        open_trades = len({t.trade_id for t in self.trades if not t.is_closed})
 
         if not closed_trades:
             return {
-                'total_trades': len(self.trades),
-                'open_trades': len(self.trades),
+                'total_trades': total_trades,
+                'open_trades': open_trades,
                 'closed_trades': 0
             }
 
-        # Basic counts
-        winning_trades = [t for t in closed_trades if t.pnl > 0]
-        losing_trades = [t for t in closed_trades if t.pnl <= 0]
-
-        # Profit/Loss statistics
-        total_pnl = sum(t.pnl for t in closed_trades)
+        # Profit/Loss, win rate, profit factor and drawdown in vectorized passes
+        pnl = np.fromiter((t.pnl for t in closed_trades), dtype=np.float64, count=len(closed_trades))
+        pnl_metrics = self.compute_pnl_metrics(pnl)
         total_return_pct = sum(t.pnl_pct for t in closed_trades)
 
-        # Win rate
-        win_rate = len(winning_trades) / len(closed_trades)
-
-        # Average P&L
-        avg_win = np.mean([t.pnl for t in winning_trades]) if winning_trades else 0
-        avg_loss = np.mean([t.pnl for t in losing_trades]) if losing_trades else 0
-
-        # Profit factor
-        total_wins = sum(t.pnl for t in winning_trades)
-        total_losses = abs(sum(t.pnl for t in losing_trades))
-        profit_factor = total_wins / total_losses if total_losses > 0 else float('inf')
-
         # Sharpe ratio (simplified)
         daily_returns = list(self.daily_pnl.values())
         if len(daily_returns) > 1:
@@ -132,33 +137,76 @@ class PerformanceAnalytics:
         else:
             sharpe_ratio = 0
 
-        # Maximum drawdown
-        cumulative_pnl = np.cumsum([t.pnl for t in closed_trades])
-        running_max = np.maximum.accumulate(cumulative_pnl)
-        drawdown = running_max - cumulative_pnl
-        max_drawdown = np.max(drawdown) if len(drawdown) > 0 else 0
-
         # Holding period analysis
         holding_periods = [t.holding_period for t in closed_trades if t.holding_period]
         avg_holding_period = np.mean(holding_periods) if holding_periods else 0
 
         return {
-            'total_trades': len(self.trades),
-            'open_trades': len(self.trades) - len(closed_trades),
-            'closed_trades': len(closed_trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
-            'win_rate': win_rate,
-            'total_pnl': total_pnl,
+            'total_trades': total_trades,
+            'open_trades': open_trades,
+            'closed_trades': total_trades - open_trades,
+            'winning_trades': pnl_metrics['winning_trades'],
+            'losing_trades': pnl_metrics['losing_trades'],
+            'win_rate': pnl_metrics['win_rate'],
+            'total_pnl': pnl_metrics['total_pnl'],
             'total_return_pct': total_return_pct,
-            'avg_win': avg_win,
-            'avg_loss': avg_loss,
-            'profit_factor': profit_factor,
+            'avg_win': pnl_metrics['avg_win'],
+            'avg_loss': pnl_metrics['avg_loss'],
+            'profit_factor': pnl_metrics['profit_factor'],
             'sharpe_ratio': sharpe_ratio,
-            'max_drawdown': max_drawdown,
+            'max_drawdown': pnl_metrics['max_drawdown'],
             'avg_holding_period_hours': avg_holding_period,
-            'best_trade': max([t.pnl for t in closed_trades]) if closed_trades else 0,
-            'worst_trade': min([t.pnl for t in closed_trades]) if closed_trades else 0
+            'best_trade': pnl_metrics['best_trade'],
+            'worst_trade': pnl_metrics['worst_trade']
+        }
+
+    @staticmethod
+    def compute_pnl_metrics(pnl: np.ndarray) -> Dict[str, Any]:
+        """
+        Aggregate P&L metrics for a series of closed trades.
+
+        Args:
+            pnl: Per-trade P&L in closing order
+
+        Returns:
+            Totals, win/loss breakdown, profit factor and maximum drawdown
+        """
+        pnl = np.asarray(pnl, dtype=np.float64)
+        if pnl.size == 0:
+            return {
+                'total_pnl': 0.0,
+                'winning_trades': 0,
+                'losing_trades': 0,
+                'win_rate': 0.0,
+                'avg_win': 0,
+                'avg_loss': 0,
+                'profit_factor': float('inf'),
+                'max_drawdown': 0,
+                'best_trade': 0,
+                'worst_trade': 0
+            }
+
+        wins = pnl > 0
+        win_pnl = pnl[wins]
+        loss_pnl = pnl[~wins]
+
+        total_wins = win_pnl.sum()
+        total_losses = abs(loss_pnl.sum())
+
+        cumulative_pnl = np.cumsum(pnl)
+        drawdown = np.maximum.accumulate(cumulative_pnl) - cumulative_pnl
+
+        return {
+            'total_pnl': float(pnl.sum()),
+            'winning_trades': int(wins.sum()),
+            'losing_trades': int(pnl.size - wins.sum()),
+            'win_rate': float(wins.mean()),
+            'avg_win': float(win_pnl.mean()) if win_pnl.size else 0,
+            'avg_loss': float(loss_pnl.mean()) if loss_pnl.size else 0,
+            'profit_factor': float(total_wins / total_losses) if total_losses > 0 else float('inf'),
+            'max_drawdown': float(drawdown.max()),
+            'best_trade': float(pnl.max()),
+            'worst_trade': float(pnl.min())
         }
 
     def get_strategy_performance(self) -> Dict[str, Dict[str, Any]]:
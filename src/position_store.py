@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Open position storage for Kalshi trading bot."""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Any, Iterator
+from config import STOP_LOSS_PERCENTAGE
+
+
+class PositionStore:
+    """
+    Net open positions per market, stored column-wise.
+
+    Quantities, entry prices and stop-loss prices live in contiguous NumPy
+    arrays indexed by row, with a market_id -> row index on the side, so
+    portfolio-wide checks run as single vectorized passes. Quantities are
+    signed: positive for long, negative for short. Each row also keeps its
+    open lots, one (trade_id, quantity, entry_price) per opening fill, so
+    closing fills can be attributed to the trades they close. Reads by
+    market id return a position dict in the same shape the trader has
+    always used.
+    """
+
+    def __init__(self, capacity: int = 16, stop_loss_pct: float = STOP_LOSS_PERCENTAGE):
+        self.stop_loss_pct = stop_loss_pct
+        self._qty = np.zeros(capacity, dtype=np.int32)
+        self._entry = np.zeros(capacity, dtype=np.float64)
+        self._stop = np.zeros(capacity, dtype=np.float64)
+        self._ids: List[str] = []
+        self._strategies: List[str] = []
+        self._lots: List[List[list]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._n = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, market_id) -> bool:
+        return market_id in self._id_to_row
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._ids))
+
+    def __getitem__(self, market_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._position(self._id_to_row[market_id])
+
+    def __delitem__(self, market_id: str):
+        with self._lock:
+            self._remove_row(self._id_to_row[market_id])
+
+    def get(self, market_id: str, default=None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._id_to_row.get(market_id)
+            return default if row is None else self._position(row)
+
+    def items(self) -> List[tuple]:
+        with self._lock:
+            return [(self._ids[row], self._position(row)) for row in range(self._n)]
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+            self._strategies.clear()
+            self._lots.clear()
+            self._id_to_row.clear()
+            self._n = 0
+
+    def add(self, market_id: str, quantity: int, price: float,
+            strategy: str = 'unknown', trade_id: Optional[str] = None) -> List[tuple]:
+        """
+        Apply a fill to the net position for a market.
+
+        A fill against the position closes its oldest lots first; whatever
+        is left of the fill opens a new lot, so flipping sides restarts from
+        the fill price. The entry price is the size-weighted average of the
+        open lots. A position netted to zero is removed.
+
+        Args:
+            market_id: Market identifier
+            quantity: Signed quantity (positive to buy, negative to sell)
+            price: Fill price
+            strategy: Strategy that generated the trade
+            trade_id: Performance analytics trade identifier
+
+        Returns:
+            List of (trade_id, quantity, entry_price) for the lot quantities
+            this fill closed, oldest first
+        """
+        with self._lock:
+            row = self._id_to_row.get(market_id)
+            if row is None:
+                row = self._append_row(market_id)
+                old_qty = 0
+            else:
+                old_qty = int(self._qty[row])
+
+            lots = self._lots[row]
+            closed = []
+            remaining = abs(quantity)
+            if old_qty != 0 and (old_qty > 0) != (quantity > 0):
+                while remaining and lots:
+                    lot = lots[0]
+                    filled = min(remaining, lot[1])
+                    closed.append((lot[0], filled, lot[2]))
+                    lot[1] -= filled
+                    remaining -= filled
+                    if lot[1] == 0:
+                        lots.pop(0)
+
+            if remaining:
+                lots.append([trade_id, remaining, price])
+                self._strategies[row] = strategy
+
+            new_qty = old_qty + quantity
+            if new_qty == 0:
+                self._remove_row(row)
+                return closed
+
+            self._qty[row] = new_qty
+            self._entry[row] = sum(lot[1] * lot[2] for lot in lots) / abs(new_qty)
+            side = 1.0 if new_qty > 0 else -1.0
+            self._stop[row] = self._entry[row] * (1 - side * self.stop_loss_pct)
+            return closed
+
+    def pop(self, market_id: str, default=None) -> Optional[Dict[str, Any]]:
+        """Remove a position and return it, or default if there is none."""
+        with self._lock:
+            row = self._id_to_row.get(market_id)
+            if row is None:
+                return default
+            position = self._position(row)
+            self._remove_row(row)
+            return position
+
+    def total_exposure(self) -> float:
+        """Total entry value of all open positions."""
+        with self._lock:
+            n = self._n
+            return float((np.abs(self._qty[:n]) * self._entry[:n]).sum())
+
+    def find_stop_loss_triggers(self, current_prices: Dict[str, float]) -> List[tuple]:
+        """
+        Find positions whose stop-loss has been hit.
+
+        Mirrors RiskManager.check_stop_loss_trigger for every position at
+        once. Markets without a current price are valued at entry.
+
+        Args:
+            current_prices: Latest price per market id
+
+        Returns:
+            List of (market_id, current_price) for triggered positions
+        """
+        with self._lock:
+            n = self._n
+            if n == 0:
+                return []
+
+            entry = self._entry[:n]
+            prices = np.fromiter((current_prices.get(market_id, entry[row])
+                                  for row, market_id in enumerate(self._ids)),
+                                 dtype=np.float64, count=n)
+            long_side = self._qty[:n] > 0
+            triggered = np.where(long_side, prices <= self._stop[:n], prices >= self._stop[:n])
+
+            return [(self._ids[row], float(prices[row])) for row in np.flatnonzero(triggered)]
+
+    def _position(self, row: int) -> Dict[str, Any]:
+        qty = int(self._qty[row])
+        return {
+            'quantity': abs(qty),
+            'entry_price': float(self._entry[row]),
+            'type': 'long' if qty > 0 else 'short',
+            'strategy': self._strategies[row],
+            'stop_loss_price': float(self._stop[row]),
+            'trade_ids': [lot[0] for lot in self._lots[row]],
+            'lots': [tuple(lot) for lot in self._lots[row]]
+        }
+
+    def _append_row(self, market_id: str) -> int:
+        row = self._n
+        if row == len(self._qty):
+            self._grow()
+        self._qty[row] = 0
+        self._ids.append(market_id)
+        self._strategies.append('unknown')
+        self._lots.append([])
+        self._id_to_row[market_id] = row
+        self._n += 1
+        return row
+
+    def _remove_row(self, row: int):
+        # Keep rows contiguous by moving the last row into the freed slot
+        last = self._n - 1
+        del self._id_to_row[self._ids[row]]
+        if row != last:
+            self._qty[row] = self._qty[last]
+            self._entry[row] = self._entry[last]
+            self._stop[row] = self._stop[last]
+            self._ids[row] = self._ids[last]
+            self._strategies[row] = self._strategies[last]
+            self._lots[row] = self._lots[last]
+            self._id_to_row[self._ids[row]] = row
+        self._ids.pop()
+        self._strategies.pop()
+        self._lots.pop()
+        self._n = last
+
+    def _grow(self):
+        capacity = max(2 * len(self._qty), 1)
+        for name in ('_qty', '_entry', '_stop'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
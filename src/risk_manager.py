@@ -15,6 +15,17 @@ class RiskManager:
         self.initial_bankroll = initial_bankroll
         self.current_bankroll = initial_bankroll
 
+    @property
+    def current_bankroll(self) -> float:
+        """Current bankroll after realized P&L."""
+        return self._current_bankroll
+
+    @current_bankroll.setter
+    def current_bankroll(self, value: float):
+        self._current_bankroll = value
+        # Cached so per-trade size checks don't recompute the limit
+        self.max_position_value = value * MAX_POSITION_SIZE_PERCENTAGE
+
     def calculate_position_size_kelly(self, confidence: float, win_loss_ratio: float = 2.0) -> float:
         """
         Simplified Kelly Criterion position sizing.
@@ -119,8 +130,7 @@ class RiskManager:
         Returns:
             True if position size is acceptable
         """
-        max_position_value = self.current_bankroll * MAX_POSITION_SIZE_PERCENTAGE
-        return position_value <= max_position_value
+        return position_value <= self.max_position_value
 
     def get_portfolio_status(self) -> Dict[str, Any]:
         """
@@ -1,13 +1,16 @@
-import pandas as pd
 import numpy as np
+import asyncio
+import itertools
 import logging
 import time
-from typing import List, Dict, Any
-from config import BANKROLL, NEWS_SENTIMENT_THRESHOLD, STAT_ARBITRAGE_THRESHOLD, VOLATILITY_THRESHOLD, MAX_POSITION_SIZE_PERCENTAGE, STOP_LOSS_PERCENTAGE
+from typing import List, Dict, Any, Optional, Union
+from config import BANKROLL, NEWS_SENTIMENT_THRESHOLD, STAT_ARBITRAGE_THRESHOLD, VOLATILITY_THRESHOLD, MAX_POSITION_SIZE_PERCENTAGE, STOP_LOSS_PERCENTAGE, NOTIFICATION_BATCH_SIZE
 from news_analyzer import NewsSentimentAnalyzer
 from arbitrage_analyzer import StatisticalArbitrageAnalyzer
 from volatility_analyzer import VolatilityAnalyzer
 from risk_manager import RiskManager
+from position_store import PositionStore
+from _numba_kernels import kelly_sizes
 from market_data_streamer import MarketDataStreamer
 from performance_analytics import PerformanceAnalytics, Trade
 from settings_manager import SettingsManager
@@ -18,7 +21,9 @@ class Trader:
         self.notifier = notifier
         self.logger = logger
         self.bankroll = bankroll
-        self.current_positions = {}
+        self.current_positions = PositionStore()
+        self._pending_notifications: List[str] = []
+        self._trade_sequence = itertools.count(1)
         self.news_analyzer = NewsSentimentAnalyzer()
         self.arbitrage_analyzer = StatisticalArbitrageAnalyzer()
         self.volatility_analyzer = VolatilityAnalyzer()
@@ -37,13 +42,13 @@ class Trader:
 
     def _on_settings_changed(self, changed_settings: Dict[str, Any]):
         """Handle dynamic settings changes."""
-        self.logger.info(f"Settings updated: {list(changed_settings.keys())}")
+        self.logger.info("Settings updated: %s", list(changed_settings.keys()))
 
         # Update market data streamer interval if changed
         if 'market_data_update_interval' in changed_settings:
             new_interval = self.settings_manager.settings.market_data_update_interval
             self.market_data_streamer.update_interval = new_interval
-            self.logger.info(f"Market data update interval changed to {new_interval}s")
+            self.logger.info("Market data update interval changed to %ss", new_interval)
 
         # Update risk manager settings if changed
         if any(key in changed_settings for key in ['kelly_fraction', 'max_position_size_pct', 'stop_loss_pct']):
@@ -64,18 +69,21 @@ class Trader:
 
         self.check_positions_for_risk_management(current_prices)
 
-        # Log significant market movements
+        # Log significant market movements (skip the scan if INFO is filtered out)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         for market_id in updated_markets:
             if market_id in all_market_data:
                 market_data = all_market_data[market_id]
                 if market_data.price_change_pct and abs(market_data.price_change_pct) > 2.0:
-                    self.logger.info(f"Market movement: {market_data.title} "
-                                   f"changed {market_data.price_change_pct:.2f}% "
-                                   f"to ${market_data.current_price:.2f}")
+                    self.logger.info("Market movement: %s changed %.2f%% to $%.2f",
+                                     market_data.title, market_data.price_change_pct,
+                                     market_data.current_price)
 
-    def analyze_market(self, market_data):
+    def analyze_market(self, market_data, sentiment_analysis=None):
         # Enhanced analysis with news sentiment
-        return self._make_trade_decision(market_data)
+        return self._make_trade_decision(market_data, sentiment_analysis)
 
     def run_trading_strategy(self):
         """
@@ -85,6 +93,61 @@ class Trader:
         market_data = self.api.get_markets() or {}
         trade_decision = self.analyze_market(market_data)
         self.execute_trade(trade_decision)
+        self.flush_notifications()
+
+    async def run_trading_strategy_async(self):
+        """
+        Asynchronous variant of run_trading_strategy for the asyncio main loop.
+        Market data and news are fetched concurrently on worker threads, so a
+        cycle waits for the slower feed rather than the sum of both. A failed
+        news fetch is logged and the cycle continues with neutral sentiment.
+        """
+        feeds = [asyncio.to_thread(self.api.get_markets)]
+        if self.settings_manager.settings.news_sentiment_enabled:
+            feeds.append(asyncio.to_thread(self.news_analyzer.get_market_relevant_news))
+
+        results = await asyncio.gather(*feeds, return_exceptions=True)
+        if isinstance(results[0], BaseException):
+            raise results[0]
+        market_data = results[0] or {}
+
+        sentiment_analysis = results[1] if len(results) > 1 else None
+        if isinstance(sentiment_analysis, Exception):
+            self.logger.error(f"Error in news sentiment analysis: {sentiment_analysis}")
+            # Neutral result, so the decision step doesn't fetch news again
+            sentiment_analysis = self.news_analyzer.analyze_news_sentiment([])
+        elif isinstance(sentiment_analysis, BaseException):
+            raise sentiment_analysis
+
+        trade_decision = await asyncio.to_thread(self.analyze_market, market_data, sentiment_analysis)
+        await asyncio.to_thread(self.execute_trade, trade_decision)
+        await asyncio.to_thread(self.flush_notifications)
+
+    def flush_notifications(self):
+        """
+        Send all queued trade notifications in as few Telegram messages as possible.
+        """
+        if not self._pending_notifications:
+            return
+
+        pending = self._pending_notifications
+        self._pending_notifications = []
+        self.notifier.send_trade_notifications(pending)
+
+    def _news_sentiment_analysis(self, news_data: List[Dict[str, Any]]) -> float:
+        """
+        Score a batch of news items in one pass and return the mean sentiment
+        mapped onto 0 (negative) to 1 (positive), with 0.5 as neutral.
+        """
+        texts = [
+            f"{item.get('title', '')} {item.get('description', '')}".strip() or item.get('content', '')
+            for item in news_data or []
+        ]
+        if not texts:
+            return 0.5
+
+        polarities = self.news_analyzer.score_texts(texts)
+        return float((polarities.mean() + 1) / 2)
 
     def _statistical_arbitrage(self, market_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -111,9 +174,34 @@ class Trader:
 
         return self.arbitrage_analyzer.find_arbitrage_opportunities(markets_with_history)
 
-    def _volatility_analysis(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _volatility_analysis(self, market_data: Union[Dict[str, Any], np.ndarray]) -> Dict[str, Any]:
         """
         Analyze volatility for a representative market and return a trade decision.
+
+        Accepts either a market data payload or a bare price series, which is
+        analyzed directly as a float64 array.
+        """
+        if market_data is not None and not isinstance(market_data, dict):
+            prices = np.asarray(market_data, dtype=np.float64)
+            selected_market = {
+                'id': 'unknown',
+                'title': '',
+                'current_price': float(prices[-1]) if prices.size else 0.0,
+                'price_history': prices
+            }
+        else:
+            selected_market = self._select_volatility_market(market_data)
+            if not selected_market:
+                return {}
+
+        volatility_analysis = self.volatility_analyzer.analyze_market_volatility(selected_market)
+        return self.volatility_analyzer.should_trade_based_on_volatility(
+            volatility_analysis, risk_tolerance=self.settings_manager.settings.volatility_threshold
+        )
+
+    def _select_volatility_market(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pick the market with the longest price history for volatility analysis.
         """
         candidate_markets = []
         if self.market_data_streamer.markets_data:
@@ -141,17 +229,41 @@ class Trader:
             return {}
 
         candidate_markets.sort(key=lambda m: len(m.get('price_history') or []), reverse=True)
-        selected_market = candidate_markets[0]
+        return candidate_markets[0]
 
-        volatility_analysis = self.volatility_analyzer.analyze_market_volatility(selected_market)
-        return self.volatility_analyzer.should_trade_based_on_volatility(
-            volatility_analysis, risk_tolerance=self.settings_manager.settings.volatility_threshold
-        )
+    def _select_trade_market(self, market_data) -> Optional[tuple]:
+        """
+        Pick the first tradeable market from the market data.
+
+        Ids and prices are extracted as columns and filtered with one vector
+        mask. A market is tradeable when it has an id and a positive current
+        price; entries that aren't market dicts are ignored.
+
+        Args:
+            market_data: Market data with a 'markets' list
 
-    def _make_trade_decision(self, market_data):
+        Returns:
+            Tuple of (event_id, current_price), or None if no market qualifies
+        """
+        markets = (market_data.get('markets') if isinstance(market_data, dict) else None) or []
+        markets = [market for market in markets if isinstance(market, dict)]
+        ids = [market.get('id') for market in markets]
+        prices = np.fromiter((market.get('current_price') or 0.0 for market in markets),
+                             dtype=np.float64, count=len(markets))
+        has_id = np.fromiter((bool(market_id) for market_id in ids), dtype=bool, count=len(ids))
+        tradeable = np.flatnonzero(has_id & (prices > 0))
+        if not tradeable.size:
+            return None
+        pick = int(tradeable[0])
+        return ids[pick], float(prices[pick])
+
+    def _make_trade_decision(self, market_data, sentiment_analysis=None):
         """
         Enhanced trade decision making with multiple strategies using dynamic settings
         Priority: News Sentiment → Statistical Arbitrage → Volatility Analysis
+
+        A prefetched news sentiment analysis may be passed in; otherwise news is
+        fetched here when the sentiment strategy is enabled.
         """
         trade_decision = None
         settings = self.settings_manager.settings
@@ -159,40 +271,39 @@ class Trader:
         # Strategy 1: News Sentiment Analysis (if enabled)
         if settings.news_sentiment_enabled:
             try:
-                sentiment_analysis = self.news_analyzer.get_market_relevant_news()
+                if sentiment_analysis is None:
+                    sentiment_analysis = self.news_analyzer.get_market_relevant_news()
                 sentiment_decision = self.news_analyzer.should_trade_based_on_sentiment(
                     sentiment_analysis, settings.news_sentiment_threshold
                 )
 
                 if sentiment_decision['should_trade']:
-                    self.logger.info(f"News sentiment signal: {sentiment_decision['reason']}")
+                    self.logger.info("News sentiment signal: %s", sentiment_decision['reason'])
 
                     # Find suitable market to trade based on sentiment
-                    if market_data and 'markets' in market_data and market_data['markets']:
-                        market = market_data['markets'][0]  # Simple selection - could be enhanced
-                        event_id = market.get('id')
-                        current_price = market.get('current_price')
-
-                        if event_id and current_price:
-                            action = 'buy' if sentiment_decision['direction'] == 'long' else 'sell'
-
-                            # Apply dynamic risk management
-                            position_size_fraction = self.risk_manager.calculate_position_size_kelly(sentiment_decision['confidence'])
-                            position_value = self.risk_manager.current_bankroll * position_size_fraction
-                            quantity = max(1, int(position_value / current_price))
-
-                            trade_decision = {
-                                'event_id': event_id,
-                                'action': action,
-                                'quantity': quantity,
-                                'price': current_price,
-                                'strategy': 'news_sentiment',
-                                'sentiment_score': sentiment_decision['sentiment_score'],
-                                'confidence': sentiment_decision['confidence']
-                            }
-
-                            self.logger.info(f"News sentiment trade decision: {action} {event_id} "
-                                           f"at {current_price} (sentiment: {sentiment_decision['sentiment_score']:.3f})")
+                    selected = self._select_trade_market(market_data)  # Simple selection - could be enhanced
+                    if selected:
+                        event_id, current_price = selected
+                        action = 'buy' if sentiment_decision['direction'] == 'long' else 'sell'
+
+                        # Apply dynamic risk management
+                        position_size_fraction = self.risk_manager.calculate_position_size_kelly(sentiment_decision['confidence'])
+                        position_value = self.risk_manager.current_bankroll * position_size_fraction
+                        quantity = max(1, int(position_value / current_price))
+
+                        trade_decision = {
+                            'event_id': event_id,
+                            'action': action,
+                            'quantity': quantity,
+                            'price': current_price,
+                            'strategy': 'news_sentiment',
+                            'sentiment_score': sentiment_decision['sentiment_score'],
+                            'confidence': sentiment_decision['confidence']
+                        }
+
+                        self.logger.info("News sentiment trade decision: %s %s at %s (sentiment: %.3f)",
+                                         action, event_id, current_price,
+                                         sentiment_decision['sentiment_score'])
 
             except Exception as e:
                 self.logger.error(f"Error in news sentiment analysis: {e}")
@@ -209,7 +320,7 @@ class Trader:
                     )
 
                     if execution_decision['should_execute']:
-                        self.logger.info(f"Arbitrage signal: {execution_decision['reason']}")
+                        self.logger.info("Arbitrage signal: %s", execution_decision['reason'])
 
                         # For simplicity, focus on one side of the arbitrage pair
                         market1 = execution_decision['market1']
@@ -238,8 +349,8 @@ class Trader:
                             'arbitrage_pair': [market1['id'], market2['id']]
                         }
 
-                        self.logger.info(f"Arbitrage trade decision: {action} {event_id} "
-                                       f"(z-score: {best_opportunity['z_score']:.3f})")
+                        self.logger.info("Arbitrage trade decision: %s %s (z-score: %.3f)",
+                                         action, event_id, best_opportunity['z_score'])
 
             except Exception as e:
                 self.logger.error(f"Error in statistical arbitrage: {e}")
@@ -249,41 +360,73 @@ class Trader:
             try:
                 volatility_decision = self._volatility_analysis(market_data)
                 if volatility_decision and volatility_decision.get('should_trade'):
-                    self.logger.info(f"Volatility signal: {volatility_decision['reason']}")
+                    self.logger.info("Volatility signal: %s", volatility_decision['reason'])
 
                     # Find market for volatility-based trade
-                    if market_data and 'markets' in market_data and market_data['markets']:
-                        market = market_data['markets'][0]  # Could be enhanced to select based on volatility
-                        event_id = market.get('id')
-                        current_price = market.get('current_price')
-
-                        if event_id and current_price and volatility_decision.get('direction'):
-                            action = 'buy' if volatility_decision['direction'] == 'long' else 'sell'
-
-                            # Apply dynamic risk management
-                            position_size_fraction = self.risk_manager.calculate_position_size_kelly(volatility_decision['confidence'])
-                            position_value = self.risk_manager.current_bankroll * position_size_fraction
-                            quantity = max(1, int(position_value / current_price))
-
-                            trade_decision = {
-                                'event_id': event_id,
-                                'action': action,
-                                'quantity': quantity,
-                                'price': current_price,
-                                'strategy': 'volatility_based',
-                                'volatility_regime': volatility_decision.get('volatility_regime'),
-                                'confidence': volatility_decision['confidence'],
-                                'signal_type': volatility_decision.get('signal_type')
-                            }
-
-                            self.logger.info(f"Volatility trade decision: {action} {event_id} "
-                                           f"(regime: {volatility_decision.get('volatility_regime')})")
+                    selected = self._select_trade_market(market_data)  # Could be enhanced to select based on volatility
+                    if selected and volatility_decision.get('direction'):
+                        event_id, current_price = selected
+                        action = 'buy' if volatility_decision['direction'] == 'long' else 'sell'
+
+                        # Apply dynamic risk management
+                        position_size_fraction = self.risk_manager.calculate_position_size_kelly(volatility_decision['confidence'])
+                        position_value = self.risk_manager.current_bankroll * position_size_fraction
+                        quantity = max(1, int(position_value / current_price))
+
+                        trade_decision = {
+                            'event_id': event_id,
+                            'action': action,
+                            'quantity': quantity,
+                            'price': current_price,
+                            'strategy': 'volatility_based',
+                            'volatility_regime': volatility_decision.get('volatility_regime'),
+                            'confidence': volatility_decision['confidence'],
+                            'signal_type': volatility_decision.get('signal_type')
+                        }
+
+                        self.logger.info("Volatility trade decision: %s %s (regime: %s)",
+                                         action, event_id, volatility_decision.get('volatility_regime'))
 
             except Exception as e:
                 self.logger.error(f"Error in volatility analysis: {e}")
 
         return trade_decision
 
+    def _size_positions(self, decisions: List[Dict[str, Any]],
+                        win_loss_ratio: float = 2.0) -> List[Dict[str, Any]]:
+        """
+        Size a batch of trade decisions with the Kelly criterion.
+
+        Confidences and odds are gathered into contiguous arrays and sized in
+        one kernel call, using the configured Kelly fraction and position cap.
+        Each decision's 'quantity' is overwritten in place; decisions with no
+        edge get a quantity of 0 and are skipped by execute_trade.
+
+        Args:
+            decisions: Trade decisions with 'confidence' and 'price'; an
+                optional 'win_loss_ratio' overrides the default odds
+            win_loss_ratio: Odds used for decisions that don't carry their own
+
+        Returns:
+            The same decisions, with quantities filled in
+        """
+        if not decisions:
+            return decisions
+
+        settings = self.settings_manager.settings
+        n = len(decisions)
+        p = np.fromiter((d['confidence'] for d in decisions), dtype=np.float64, count=n)
+        b = np.fromiter((d.get('win_loss_ratio', win_loss_ratio) for d in decisions),
+                        dtype=np.float64, count=n)
+        prices = np.fromiter((d['price'] for d in decisions), dtype=np.float64, count=n)
+
+        fractions = kelly_sizes(p, b, settings.kelly_fraction, settings.max_position_size_pct)
+        quantities = (self.risk_manager.current_bankroll * fractions / prices).astype(np.int64)
+
+        for decision, quantity in zip(decisions, quantities.tolist()):
+            decision['quantity'] = quantity
+        return decisions
+
     def execute_trade(self, trade_decision):
         """
         Execute trade with basic risk management
@@ -298,122 +441,134 @@ class Trader:
         price = trade_decision['price']
         strategy = trade_decision.get('strategy', 'unknown')
 
+        # Resolve attributes used on every fill once, up front
+        logger = self.logger
+        side = action.lower()
+
         try:
-            # Validate position size
-            position_value = quantity * price
-            if not self.risk_manager.validate_position_size(position_value):
-                self.logger.warning(f"Position size ${position_value:.2f} exceeds risk limits")
+            # Clamp to the largest quantity within the position size limit
+            max_quantity = int(self.risk_manager.max_position_value / price)
+            if quantity > max_quantity:
+                logger.warning(f"Position size ${quantity * price:.2f} exceeds risk limits, "
+                               f"reducing to {max_quantity} units")
+                quantity = max_quantity
+            if quantity <= 0:
                 return
 
-            self.logger.info(f"Executing {strategy} trade: {action} {quantity} units of {event_id} "
-                           f"at ${price:.2f}")
+            logger.info("Executing %s trade: %s %s units of %s at $%.2f",
+                        strategy, action, quantity, event_id, price)
 
-            # Generate unique trade ID
-            trade_id = f"{strategy}_{event_id}_{int(time.time())}"
+            # Generate unique trade ID (the sequence separates fills within a second)
+            trade_id = f"{strategy}_{event_id}_{int(time.time())}_{next(self._trade_sequence)}"
 
             # Execute the trade via API (placeholder for now)
-            if action.lower() == 'buy':
-                self.logger.info(f"BUY ORDER: {quantity} units of {event_id} at ${price:.2f}")
-            elif action.lower() == 'sell':
-                self.logger.info(f"SELL ORDER: {quantity} units of {event_id} at ${price:.2f}")
-
-            # Record trade in performance analytics
-            trade = Trade(
-                trade_id=trade_id,
-                market_id=event_id,
-                strategy=strategy,
-                side=action.lower(),
-                quantity=quantity,
-                entry_price=price,
-                confidence=trade_decision.get('confidence', 0.5)
-            )
-            self.performance_analytics.record_trade(trade)
-
-            # Store position locally for basic tracking
-            self.current_positions[event_id] = {
-                'quantity': quantity,
-                'entry_price': price,
-                'type': 'long' if action.lower() == 'buy' else 'short',
-                'strategy': strategy,
-                'stop_loss_price': self.risk_manager.calculate_stop_loss_price(
-                    price, action.lower() == 'buy'
-                ),
-                'trade_id': trade_id
-            }
+            if side == 'buy':
+                logger.info("BUY ORDER: %s units of %s at $%.2f", quantity, event_id, price)
+            elif side == 'sell':
+                logger.info("SELL ORDER: %s units of %s at $%.2f", quantity, event_id, price)
+
+            # Net the fill into the local position; it may close earlier lots
+            signed_quantity = quantity if side == 'buy' else -quantity
+            closed_lots = self.current_positions.add(event_id, signed_quantity, price, strategy, trade_id)
+            if closed_lots:
+                pnl = self._realize_lots(closed_lots, price, side == 'sell', 'closing_fill')
+                logger.info("Closing fill on %s realized P&L $%.2f", event_id, pnl)
+
+            # Record whatever the fill opened in performance analytics
+            opened_quantity = quantity - sum(lot[1] for lot in closed_lots)
+            if opened_quantity > 0:
+                trade = Trade(
+                    trade_id=trade_id,
+                    market_id=event_id,
+                    strategy=strategy,
+                    side=side,
+                    quantity=opened_quantity,
+                    entry_price=price,
+                    confidence=trade_decision.get('confidence', 0.5)
+                )
+                self.performance_analytics.record_trade(trade)
 
-            # Send notification
-            self.notifier.send_trade_notification(
+            # Queue notification; flushed at the end of the strategy cycle
+            pending = self._pending_notifications
+            pending.append(
                 f"{strategy.upper()}: {action.upper()} {quantity} units of {event_id} at ${price:.2f}"
             )
+            if len(pending) >= NOTIFICATION_BATCH_SIZE:
+                self.flush_notifications()
 
         except Exception as e:
-            self.logger.error(f"Error executing {strategy} trade for {event_id}: {e}")
+            logger.error(f"Error executing {strategy} trade for {event_id}: {e}")
             self.notifier.send_error_notification(f"Trade execution error for {event_id}: {e}")
 
     def check_positions_for_risk_management(self, current_prices: Dict[str, float]):
         """
         Check all open positions for stop-loss triggers.
         """
-        positions_to_close = []
-
-        for market_id, position in self.current_positions.items():
-            current_price = current_prices.get(market_id, position['entry_price'])
-
-            # Check stop-loss
-            if self.risk_manager.check_stop_loss_trigger(
-                position['entry_price'], current_price, position['type'] == 'long'
-            ):
-                positions_to_close.append({
-                    'market_id': market_id,
-                    'exit_price': current_price,
-                    'reason': 'stop_loss_triggered'
-                })
+        triggered = self.current_positions.find_stop_loss_triggers(current_prices)
 
         # Close positions that hit stop-loss
-        for close_info in positions_to_close:
-            self.close_position_simple(close_info['market_id'],
-                                     close_info['exit_price'],
-                                     close_info['reason'])
+        for market_id, exit_price in triggered:
+            self.close_position_simple(market_id, exit_price, 'stop_loss_triggered')
 
     def close_position_simple(self, market_id: str, exit_price: float, reason: str):
         """
         Close a position with simple P&L calculation.
         """
-        if market_id not in self.current_positions:
+        # Single lookup that also removes the position
+        position = self.current_positions.pop(market_id, None)
+        if position is None:
             return
 
-        position = self.current_positions[market_id]
+        # Realize P&L on every open lot of the position
+        pnl = self._realize_lots(position['lots'], exit_price, position['type'] == 'long', reason)
 
-        # Calculate P&L
-        entry_price = position['entry_price']
-        quantity = position['quantity']
+        # Send notification
+        self.notifier.send_trade_notification(
+            f"RISK MANAGEMENT: Closed {market_id} at ${exit_price:.2f}, P&L: ${pnl:.2f} ({reason})"
+        )
 
-        if position['type'] == 'long':
-            pnl = (exit_price - entry_price) * quantity
-        else:  # short
-            pnl = (entry_price - exit_price) * quantity
+        self.logger.info("Closed position %s: P&L $%.2f, reason: %s", market_id, pnl, reason)
 
-        # Update bankroll
-        self.risk_manager.current_bankroll += pnl
+    def _realize_lots(self, lots: List[tuple], exit_price: float, is_long: bool, reason: str) -> float:
+        """
+        Realize P&L on closed position lots.
 
-        # Record trade closure in performance analytics
-        trade_id = position.get('trade_id')
-        if trade_id:
-            self.performance_analytics.close_trade(trade_id, exit_price, reason)
+        Updates the bankroll and closes the matching performance analytics
+        trades, so both always book the same P&L.
 
-        # Remove from positions
-        del self.current_positions[market_id]
+        Args:
+            lots: (trade_id, quantity, entry_price) for each closed lot
+            exit_price: Price the lots were closed at
+            is_long: True if the lots were long
+            reason: Exit reason recorded on the trades
 
-        # Send notification
-        self.notifier.send_trade_notification(
-            f"RISK MANAGEMENT: Closed {market_id} at ${exit_price:.2f}, P&L: ${pnl:.2f} ({reason})"
-        )
+        Returns:
+            Total realized P&L
+        """
+        pnl = 0.0
+        for trade_id, quantity, entry_price in lots:
+            if is_long:
+                pnl += (exit_price - entry_price) * quantity
+            else:  # short
+                pnl += (entry_price - exit_price) * quantity
+            if trade_id:
+                self.performance_analytics.close_trade(trade_id, exit_price, reason, quantity)
+
+        self.risk_manager.current_bankroll += pnl
+        return pnl
 
-        self.logger.info(f"Closed position {market_id}: P&L ${pnl:.2f}, reason: {reason}")
+    def total_exposure(self) -> float:
+        """
+        Total entry value committed to open positions.
+        """
+        return self.current_positions.total_exposure()
 
     def get_portfolio_status(self):
         """
         Get portfolio status with basic risk metrics.
         """
-        return self.risk_manager.get_portfolio_status()
+        status = self.risk_manager.get_portfolio_status()
+        status['open_positions'] = len(self.current_positions)
+        status['total_exposure'] = self.total_exposure()
+        return status
 
@@ -1,13 +1,13 @@
 def validate_api_key(api_key):
-    if not api_key or not isinstance(api_key, str):
+    if (type(api_key) is not str and not isinstance(api_key, str)) or not api_key:
         raise ValueError("Invalid API key provided.")
 
 def validate_telegram_token(token):
-    if not token or not isinstance(token, str):
+    if (type(token) is not str and not isinstance(token, str)) or not token:
         raise ValueError("Invalid Telegram bot token provided.")
 
 def validate_chat_id(chat_id):
-    if not isinstance(chat_id, int):
+    if type(chat_id) is not int and not isinstance(chat_id, int):
         raise ValueError("Invalid chat ID provided. It must be an integer.")
 
 def format_trade_message(trade_details):
@@ -4,6 +4,7 @@
 import logging
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, List, Optional, Any, Tuple
 from arch import arch_model
 from statsmodels.tsa.stattools import adfuller
@@ -39,7 +40,7 @@ class VolatilityAnalyzer:
             }
 
         try:
-            prices_array = np.array(prices, dtype=float)
+            prices_array = np.asarray(prices, dtype=np.float64)
 
             # Calculate returns
             returns = np.diff(np.log(prices_array))
@@ -52,9 +53,8 @@ class VolatilityAnalyzer:
 
             # Parkinson volatility (if we had high/low data)
             # For now, approximate with range-based measure
-            rolling_max = pd.Series(prices_array).rolling(window=window).max()
-            rolling_min = pd.Series(prices_array).rolling(window=window).min()
-            parkinson_vol = np.log(rolling_max / rolling_min).mean() * np.sqrt(252 / window)
+            windows = sliding_window_view(prices_array, window)
+            parkinson_vol = np.log(windows.max(axis=1) / windows.min(axis=1)).mean() * np.sqrt(252 / window)
 
             return {
                 'historical_volatility': float(hist_vol),
@@ -73,6 +73,44 @@ class VolatilityAnalyzer:
                 'error': str(e)
             }
 
+    def calculate_rolling_volatilities(self, prices: np.ndarray, window: int = 20,
+                                       step: int = 10) -> np.ndarray:
+        """
+        Calculate annualized historical volatility at every `step` points.
+
+        Equivalent to calling calculate_historical_volatility on each prefix
+        prices[:i+1] for i in range(step, len(prices), step), but computed in a
+        single vectorized pass over the log returns.
+
+        Args:
+            prices: Price series
+            window: Rolling window for volatility calculation
+            step: Spacing between sampled prefixes
+
+        Returns:
+            Array of annualized volatilities, one per sampled prefix
+        """
+        prices_array = np.asarray(prices, dtype=np.float64)
+        ends = np.arange(step, len(prices_array), step)
+        vols = np.zeros(len(ends), dtype=np.float64)
+        if len(prices_array) < window:
+            return vols
+
+        log_returns = np.diff(np.log(prices_array))
+
+        # A prefix of exactly `window` prices only has window - 1 returns
+        partial = ends == window - 1
+        if partial.any():
+            vols[partial] = np.std(log_returns[:window - 1])
+
+        # Longer prefixes map onto one row of the rolling standard deviation
+        if len(log_returns) >= window:
+            rolling_std = sliding_window_view(log_returns, window).std(axis=1)
+            full = ends >= window
+            vols[full] = rolling_std[ends[full] - window]
+
+        return vols * np.sqrt(252)
+
     def fit_garch_model(self, returns: List[float]) -> Dict[str, Any]:
         """
         Fit GARCH(1,1) model to returns data.
@@ -254,7 +292,7 @@ class VolatilityAnalyzer:
         Returns:
             Complete volatility analysis
         """
-        price_history = market_data.get('price_history', [])
+        price_history = np.asarray(market_data.get('price_history', []), dtype=np.float64)
 
         if len(price_history) < self.min_history_points:
             return {
@@ -267,16 +305,13 @@ class VolatilityAnalyzer:
             hist_vol_analysis = self.calculate_historical_volatility(price_history)
 
             # Fit GARCH model
-            returns = np.diff(np.log(np.array(price_history, dtype=float)))
+            returns = np.diff(np.log(price_history))
             garch_analysis = self.fit_garch_model(returns.tolist())
 
             # Analyze volatility regime
             current_vol = hist_vol_analysis.get('historical_volatility', 0)
-            # Use recent volatility history for regime analysis
-            recent_vols = []
-            for i in range(10, len(price_history), 10):  # Every 10 points
-                window_vol = self.calculate_historical_volatility(price_history[:i+1])
-                recent_vols.append(window_vol.get('historical_volatility', 0))
+            # Use recent volatility history for regime analysis (every 10 points)
+            recent_vols = self.calculate_rolling_volatilities(price_history, step=10).tolist()
 
             regime_analysis = self.analyze_volatility_regime(current_vol, recent_vols)
 
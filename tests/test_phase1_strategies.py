@@ -53,6 +53,24 @@ class TestNewsSentimentAnalyzer(unittest.TestCase):
         self.assertIn('subjectivity', sentiment)
         self.assertGreater(sentiment['polarity'], 0)  # Should be positive
 
+    def test_batch_scoring_matches_textblob(self):
+        """Test compiled batch scoring against TextBlob on plain, modified and negated text"""
+        texts = [article['description'] for article in self.sample_articles] + [
+            'not good', 'very good!', 'not a really bad ruling', 'really not good'
+        ]
+        scores = self.analyzer.score_texts(texts)
+
+        self.assertEqual(len(scores), len(texts))
+        for text, score in zip(texts, scores):
+            expected = self.analyzer.analyze_sentiment(self.analyzer.preprocess_text(text))['polarity']
+            self.assertAlmostEqual(float(score), expected, places=9)
+
+        # Aggregation uses the same batch scores
+        result = self.analyzer.analyze_news_sentiment(self.sample_articles)
+        polarities = [self.analyzer.analyze_sentiment(self.analyzer.preprocess_text(
+            f"{article['title']} {article['description']}"))['polarity'] for article in self.sample_articles]
+        self.assertAlmostEqual(result['overall_sentiment'], round(sum(polarities) / len(polarities), 3))
+
     def test_text_preprocessing(self):
         """Test text preprocessing functionality"""
         raw_text = "Check this link: https://example.com/article @user #hashtag!"
@@ -185,6 +203,22 @@ class TestStatisticalArbitrageAnalyzer(unittest.TestCase):
         opportunities = self.analyzer.find_arbitrage_opportunities(markets)
         self.assertIsInstance(opportunities, list)
 
+    def test_pair_screening_matches_spread_zscores(self):
+        """Test that pair screening agrees with the full spread calculation"""
+        markets = [
+            {'id': 'market1', 'price_history': self.price_series_1},
+            {'id': 'market2', 'price_history': self.price_series_2},
+            {'id': 'market3', 'price_history': self.price_series_1[:60]}
+        ]
+
+        candidates = self.analyzer.screen_pair_candidates(markets)
+
+        z_score = self.analyzer.calculate_spread(self.price_series_1, self.price_series_2)['z_score']
+        self.assertEqual(candidates[0, 1], abs(z_score) > config.STAT_ARBITRAGE_THRESHOLD)
+        # Pairs with mismatched history lengths are left for the full analysis
+        self.assertTrue(candidates[0, 2])
+        self.assertTrue(candidates[1, 2])
+
     def test_arbitrage_execution_decision(self):
         """Test arbitrage execution decision making"""
         arbitrage_analysis = {
@@ -223,6 +257,16 @@ class TestVolatilityAnalyzer(unittest.TestCase):
         self.assertIn('realized_volatility', result)
         self.assertGreater(result['historical_volatility'], 0)
 
+    def test_rolling_volatilities_match_prefix_calculation(self):
+        """Test vectorized rolling volatilities against per-prefix calculation"""
+        expected = [
+            self.analyzer.calculate_historical_volatility(self.high_vol_prices[:i+1])['historical_volatility']
+            for i in range(10, len(self.high_vol_prices), 10)
+        ]
+        result = self.analyzer.calculate_rolling_volatilities(np.array(self.high_vol_prices))
+
+        np.testing.assert_allclose(result, expected)
+
     def test_volatility_regime_analysis(self):
         """Test volatility regime classification"""
         # Test with high volatility history
@@ -326,6 +370,33 @@ class TestMultiStrategyIntegration(unittest.TestCase):
                 self.assertIsNotNone(decision)
                 self.assertEqual(decision['strategy'], 'news_sentiment')
 
+    def test_untradeable_markets_are_skipped(self):
+        """Test that malformed or unpriced markets are not selected for trading"""
+        market_data = {
+            'markets': [
+                None,
+                {'id': 'no_price', 'current_price': None},
+                {'id': 'test_market', 'current_price': 1.0}
+            ]
+        }
+
+        with patch.object(self.trader.news_analyzer, 'should_trade_based_on_sentiment') as mock_decision:
+            mock_decision.return_value = {
+                'should_trade': True,
+                'direction': 'long',
+                'sentiment_score': 0.8,
+                'confidence': 0.9,
+                'reason': 'Strong positive sentiment'
+            }
+
+            decision = self.trader._make_trade_decision(market_data, sentiment_analysis={})
+
+            self.assertEqual(decision['event_id'], 'test_market')
+            self.assertEqual(decision['price'], 1.0)
+
+            # A payload with only malformed entries yields no trade instead of raising
+            self.assertIsNone(self.trader._make_trade_decision({'markets': [None]}, sentiment_analysis={}))
+
     def test_arbitrage_strategy(self):
         """Test statistical arbitrage strategy in trader"""
         # Mock market data with multiple markets
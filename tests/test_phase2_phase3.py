@@ -14,6 +14,7 @@ from unittest.mock import Mock, patch, MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from risk_manager import RiskManager
+from position_store import PositionStore
 from market_data_streamer import MarketDataStreamer, MarketData
 from performance_analytics import PerformanceAnalytics, Trade
 from trader import Trader
@@ -67,6 +68,15 @@ class TestPhase2RiskManagement(unittest.TestCase):
         self.assertFalse(self.risk_manager.check_stop_loss_trigger(
             entry_price, current_price_above_stop, is_long=True))
 
+    def test_position_limit_tracks_bankroll(self):
+        """Test that the cached position limit follows bankroll changes"""
+        self.assertTrue(self.risk_manager.validate_position_size(1000))
+        self.assertFalse(self.risk_manager.validate_position_size(1001))
+
+        self.risk_manager.current_bankroll -= 5000
+        self.assertAlmostEqual(self.risk_manager.max_position_value, 500)
+        self.assertFalse(self.risk_manager.validate_position_size(501))
+
     def test_portfolio_risk_metrics(self):
         """Test portfolio risk metrics calculation"""
         # Create sample returns
@@ -109,6 +119,68 @@ class TestPhase2RiskManagement(unittest.TestCase):
         self.assertEqual(status['total_pnl'], 0)
 
 
+class TestPhase2PositionStore(unittest.TestCase):
+    """Test Phase 2: Column-wise open position storage"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.risk_manager = RiskManager(initial_bankroll=10000)
+        self.positions = PositionStore(capacity=2)
+
+    def test_position_netting(self):
+        """Test that fills net into a single position per market"""
+        self.positions.add('market1', 10, 1.0, 'news_sentiment', 'trade_1')
+        self.positions.add('market1', 10, 2.0, 'news_sentiment', 'trade_2')
+
+        position = self.positions['market1']
+        self.assertEqual(position['quantity'], 20)
+        self.assertAlmostEqual(position['entry_price'], 1.5)
+        self.assertEqual(position['type'], 'long')
+        self.assertEqual(position['trade_ids'], ['trade_1', 'trade_2'])
+
+        # A partial sell closes the oldest lot first
+        closed = self.positions.add('market1', -15, 1.8)
+        self.assertEqual(closed, [('trade_1', 10, 1.0), ('trade_2', 5, 2.0)])
+        self.assertEqual(self.positions['market1']['quantity'], 5)
+        self.assertAlmostEqual(self.positions['market1']['entry_price'], 2.0)
+
+        # Selling the rest closes the position
+        closed = self.positions.add('market1', -5, 1.8)
+        self.assertEqual(closed, [('trade_2', 5, 2.0)])
+        self.assertNotIn('market1', self.positions)
+        self.assertEqual(len(self.positions), 0)
+
+    def test_rows_stay_consistent_after_removal(self):
+        """Test growth past capacity and removal of a middle row"""
+        for i in range(5):
+            self.positions.add(f'market{i}', -(i + 1), 1.0 + i)
+
+        del self.positions['market1']
+
+        self.assertEqual(len(self.positions), 4)
+        self.assertEqual(self.positions['market4']['quantity'], 5)
+        self.assertEqual(self.positions['market4']['type'], 'short')
+        self.assertAlmostEqual(self.positions.total_exposure(), 1 * 1.0 + 3 * 3.0 + 4 * 4.0 + 5 * 5.0)
+
+    def test_stop_loss_triggers_match_risk_manager(self):
+        """Test vectorized stop-loss detection against RiskManager"""
+        self.positions.add('long_hit', 10, 1.0)
+        self.positions.add('long_ok', 10, 1.0)
+        self.positions.add('short_hit', -10, 1.0)
+        self.positions.add('no_price', 10, 1.0)
+        current_prices = {'long_hit': 0.9, 'long_ok': 0.99, 'short_hit': 1.1}
+
+        triggered = dict(self.positions.find_stop_loss_triggers(current_prices))
+
+        for market_id, position in self.positions.items():
+            current_price = current_prices.get(market_id, position['entry_price'])
+            expected = self.risk_manager.check_stop_loss_trigger(
+                position['entry_price'], current_price, position['type'] == 'long')
+            self.assertEqual(market_id in triggered, expected, market_id)
+            self.assertAlmostEqual(position['stop_loss_price'], self.risk_manager.calculate_stop_loss_price(
+                position['entry_price'], position['type'] == 'long'))
+
+
 class TestPhase3MarketDataStreaming(unittest.TestCase):
     """Test Phase 3: Real-Time Market Data Streaming"""
 
@@ -413,6 +485,99 @@ class TestPhase2Phase3Integration(unittest.TestCase):
         self.assertEqual(recorded_trade.market_id, 'test_market')
         self.assertEqual(recorded_trade.strategy, 'news_sentiment')
 
+    def test_oversized_trade_is_clamped(self):
+        """Test that trades above the position limit are reduced to fit"""
+        trade_decision = {
+            'event_id': 'test_market',
+            'action': 'buy',
+            'quantity': 5000,
+            'price': 0.5,
+            'strategy': 'news_sentiment'
+        }
+
+        self.trader.execute_trade(trade_decision)
+
+        # 10% of a 10000 bankroll buys 2000 units at 0.5
+        self.assertEqual(self.trader.current_positions['test_market']['quantity'], 2000)
+        self.mock_logger.warning.assert_called_once()
+
+    def test_batch_kelly_sizing(self):
+        """Test that a batch of decisions is sized by fractional Kelly"""
+        settings = self.trader.settings_manager.settings
+        settings.kelly_fraction = 0.5
+        settings.max_position_size_pct = 0.10
+
+        decisions = [
+            {'event_id': 'strong', 'confidence': 0.8, 'price': 0.5},
+            {'event_id': 'modest', 'confidence': 0.4, 'price': 0.5},
+            {'event_id': 'no_edge', 'confidence': 0.3, 'price': 0.5},
+        ]
+
+        sized = self.trader._size_positions(decisions)
+
+        # Half-Kelly of 0.35 is capped at 10%; 0.4 at 2:1 odds gives 5%
+        self.assertEqual([d['quantity'] for d in sized], [2000, 1000, 0])
+
+    def test_sell_to_flat_realizes_pnl(self):
+        """Test that an opposite fill closing a position books its P&L"""
+        self.trader.execute_trade({'event_id': 'M', 'action': 'buy', 'quantity': 10, 'price': 0.5})
+        self.trader.execute_trade({'event_id': 'M', 'action': 'sell', 'quantity': 10, 'price': 0.7})
+
+        self.assertNotIn('M', self.trader.current_positions)
+        self.assertAlmostEqual(self.trader.risk_manager.current_bankroll, 10002.0)
+
+        trades = self.trader.performance_analytics.trades
+        self.assertEqual(len(trades), 1)
+        self.assertTrue(trades[0].is_closed)
+        self.assertAlmostEqual(trades[0].pnl, 2.0)
+
+    def test_partial_closes_count_as_one_trade(self):
+        """Test that a trade closed in two parts is still counted once"""
+        self.trader.execute_trade({'event_id': 'M', 'action': 'buy', 'quantity': 10, 'price': 0.5})
+        self.trader.execute_trade({'event_id': 'M', 'action': 'sell', 'quantity': 4, 'price': 0.6})
+
+        stats = self.trader.performance_analytics.get_trade_statistics()
+        self.assertEqual((stats['total_trades'], stats['open_trades'], stats['closed_trades']), (1, 1, 0))
+        self.assertAlmostEqual(stats['total_pnl'], 0.4)
+
+        self.trader.execute_trade({'event_id': 'M', 'action': 'sell', 'quantity': 6, 'price': 0.7})
+
+        stats = self.trader.performance_analytics.get_trade_statistics()
+        self.assertEqual((stats['total_trades'], stats['open_trades'], stats['closed_trades']), (1, 0, 1))
+        self.assertAlmostEqual(stats['total_pnl'], 1.6)
+        self.assertAlmostEqual(self.trader.risk_manager.current_bankroll, 10001.6)
+
+    def test_close_after_adding_closes_every_trade(self):
+        """Test that closing an added-to position closes all of its trades"""
+        self.trader.execute_trade({'event_id': 'M', 'action': 'buy', 'quantity': 10, 'price': 0.5})
+        self.trader.execute_trade({'event_id': 'M', 'action': 'buy', 'quantity': 10, 'price': 0.7})
+
+        self.trader.close_position_simple('M', 0.8, 'take_profit')
+
+        trades = self.trader.performance_analytics.trades
+        self.assertEqual(len({trade.trade_id for trade in trades}), 2)
+        self.assertTrue(all(trade.is_closed for trade in trades))
+        self.assertAlmostEqual(sum(trade.pnl for trade in trades), 4.0)
+        self.assertAlmostEqual(self.trader.risk_manager.current_bankroll, 10004.0)
+
+    def test_close_position_updates_bankroll(self):
+        """Test closing a position realizes P&L and removes it"""
+        self.trader.execute_trade({
+            'event_id': 'test_market',
+            'action': 'sell',
+            'quantity': 100,
+            'price': 1.0,
+            'strategy': 'news_sentiment'
+        })
+
+        self.trader.close_position_simple('test_market', 0.8, 'manual')
+        self.assertNotIn('test_market', self.trader.current_positions)
+        self.assertAlmostEqual(self.trader.risk_manager.current_bankroll, 10020)
+
+        # Closing a market without a position is a no-op
+        self.trader.close_position_simple('test_market', 0.8, 'manual')
+        self.assertAlmostEqual(self.trader.risk_manager.current_bankroll, 10020)
+
     def test_market_data_streamer_integration(self):
         """Test market data streamer integration"""
         # Check that market data streamer exists
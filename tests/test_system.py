@@ -5,12 +5,17 @@ Tests all major components and their interactions
 """
 
 import unittest
+import asyncio
+import logging
 import sys
 import os
 import time
 import requests
+import httpx
+import orjson
 import subprocess
 import signal
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 
 # Add src directory to path
@@ -22,6 +27,22 @@ import trader
 import notifier
 import logger
 import utils
+import performance_analytics
+
+SERVER_URL = 'http://localhost:3001'
+HEALTH_URL = f'{SERVER_URL}/health'
+
+def wait_for_server(process=None, url=HEALTH_URL, delays=(0.1, 0.2, 0.4, 0.8, 1.5, 2.0)):
+    """Poll the health endpoint with backoff until it answers; False if it never does"""
+    for delay in delays:
+        try:
+            requests.get(url, timeout=0.5)
+            return True
+        except requests.exceptions.RequestException:
+            if process is not None and process.poll() is not None:
+                return False  # Server exited, no point waiting
+            time.sleep(delay)
+    return False
 
 class TestSystemIntegration(unittest.TestCase):
     """Test system integration and component interactions"""
@@ -60,12 +81,11 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertEqual(api.api_key, self.test_config['KALSHI_API_KEY'])
         self.assertEqual(api.base_url, custom_base)
     
-    @patch('requests.get')
-    def test_kalshi_api_market_data_fetch(self, mock_get):
+    def test_kalshi_api_market_data_fetch(self):
         """Test market data fetching from Kalshi API"""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             'markets': [
                 {
                     'id': 'TEST_MARKET',
@@ -75,13 +95,17 @@ class TestSystemIntegration(unittest.TestCase):
                     'current_price': 0.65
                 }
             ]
-        }
+        })
         mock_response.status_code = 200
-        mock_get.return_value = mock_response
         
         api = kalshi_api.KalshiAPI(self.test_config['KALSHI_API_KEY'])
-        market_data = api.fetch_market_data()
+        with patch.object(api._session, 'request', return_value=mock_response) as mock_request:
+            market_data = api.fetch_market_data()
+            api.fetch_market_data()
         
+        # Both polls go through the same pooled session
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(api._session.headers['Authorization'], f"Bearer {self.test_config['KALSHI_API_KEY']}")
         self.assertIsNotNone(market_data)
         self.assertIn('markets', market_data)
         self.assertEqual(len(market_data['markets']), 1)
@@ -122,9 +146,10 @@ class TestSystemIntegration(unittest.TestCase):
         
         # This should not raise an exception and should execute
         trader_instance.execute_trade(large_trade)
+        trader_instance.flush_notifications()
         
         # Verify notifier was called (indicating trade was processed)
-        mock_notifier.send_trade_notification.assert_called()
+        mock_notifier.send_trade_notifications.assert_called()
     
     def test_risk_management_stop_loss(self):
         """Test stop-loss risk management"""
@@ -156,11 +181,64 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertEqual(notifier_instance.bot_token, self.test_config['TELEGRAM_BOT_TOKEN'])
         self.assertEqual(notifier_instance.chat_id, self.test_config['TELEGRAM_CHAT_ID'])
     
+    def test_notifier_batches_trade_notifications(self):
+        """Test that queued trade notifications are packed under Telegram's length limit"""
+        notifier_instance = notifier.Notifier(
+            self.test_config['TELEGRAM_BOT_TOKEN'],
+            self.test_config['TELEGRAM_CHAT_ID']
+        )
+        messages = [f"TRADE {i}: " + "x" * 1000 for i in range(6)]
+
+        with patch.object(notifier_instance, 'send_message') as mock_send:
+            notifier_instance.send_trade_notifications(messages)
+
+        sent = [call.args[0] for call in mock_send.call_args_list]
+        self.assertEqual(len(sent), 2)
+        self.assertTrue(all(len(text) <= config.TELEGRAM_MAX_MESSAGE_LENGTH for text in sent))
+        self.assertEqual(sum(text.count('TRADE') for text in sent), len(messages))
+
+        # A single message over the limit is split rather than sent oversize
+        oversized = "TRADE big: " + "y" * (2 * config.TELEGRAM_MAX_MESSAGE_LENGTH)
+        with patch.object(notifier_instance, 'send_message') as mock_send:
+            notifier_instance.send_trade_notifications([oversized])
+
+        sent = [call.args[0] for call in mock_send.call_args_list]
+        self.assertEqual(len(sent), 3)
+        self.assertTrue(all(len(text) <= config.TELEGRAM_MAX_MESSAGE_LENGTH for text in sent))
+        self.assertEqual("".join(text[len(notifier.TRADE_PREFIX):] for text in sent), oversized)
+    
+    def test_trade_notifications_flushed_once_per_cycle(self):
+        """Test that trade notifications are queued and sent together"""
+        mock_notifier = Mock()
+        trader_instance = trader.Trader(Mock(), mock_notifier, Mock(), 1000)
+
+        for event_id in ('EVENT_A', 'EVENT_B'):
+            trader_instance.execute_trade({
+                'event_id': event_id,
+                'action': 'buy',
+                'quantity': 10,
+                'price': 0.5
+            })
+        mock_notifier.send_trade_notifications.assert_not_called()
+
+        trader_instance.flush_notifications()
+        mock_notifier.send_trade_notifications.assert_called_once()
+        self.assertEqual(len(mock_notifier.send_trade_notifications.call_args.args[0]), 2)
+    
     def test_logger_initialization(self):
         """Test logging system initialization"""
         logger_instance = logger.Logger()
         self.assertIsNotNone(logger_instance)
     
+    def test_logger_lazy_formatting(self):
+        """Test that the logger wrapper forwards %-style arguments"""
+        logger_instance = logger.Logger()
+        with self.assertLogs('KalshiTradingBot', level='INFO') as captured:
+            logger_instance.info("BUY ORDER: %s units of %s at $%.2f", 10, 'TEST_EVENT', 0.5)
+
+        self.assertIn("BUY ORDER: 10 units of TEST_EVENT at $0.50", captured.output[0])
+        self.assertTrue(logger_instance.isEnabledFor(logging.INFO))
+    
     def test_utils_functions(self):
         """Test utility functions"""
         # Test that utils module can be imported and has expected functions
@@ -169,12 +247,21 @@ class TestSystemIntegration(unittest.TestCase):
 class TestTradingStrategies(unittest.TestCase):
     """Test trading strategy implementations"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one trader shared by the strategy tests"""
+        cls.mock_api = Mock()
+        cls.mock_notifier = Mock()
+        cls.mock_logger = Mock()
+        cls.trader_instance = trader.Trader(cls.mock_api, cls.mock_notifier, cls.mock_logger, 1000)
+
     def setUp(self):
-        """Set up test environment for strategy testing"""
-        self.mock_api = Mock()
-        self.mock_notifier = Mock()
-        self.mock_logger = Mock()
-        self.trader_instance = trader.Trader(self.mock_api, self.mock_notifier, self.mock_logger, 1000)
+        """Reset the shared trader's mutable state between tests"""
+        self.mock_api.reset_mock()
+        self.mock_notifier.reset_mock()
+        self.mock_logger.reset_mock()
+        self.trader_instance.current_positions.clear()
+        self.trader_instance._pending_notifications.clear()
     
     def test_news_sentiment_analysis(self):
         """Test news sentiment analysis strategy"""
@@ -217,6 +304,34 @@ class TestTradingStrategies(unittest.TestCase):
         # Should return None or a trade decision
         self.assertTrue(volatility_result is None or isinstance(volatility_result, dict))
 
+    def test_async_strategy_cycle_prefetches_feeds(self):
+        """Test that the async strategy cycle fetches market data and news up front"""
+        self.mock_api.get_markets.return_value = {'markets': []}
+        sentiment = {'overall_sentiment': 0.0, 'confidence': 0.0}
+
+        with patch.object(self.trader_instance.news_analyzer, 'get_market_relevant_news',
+                          return_value=sentiment) as mock_news:
+            with patch.object(self.trader_instance, 'analyze_market', return_value=None) as mock_analyze:
+                asyncio.run(self.trader_instance.run_trading_strategy_async())
+
+        self.mock_api.get_markets.assert_called_once()
+        mock_news.assert_called_once()
+        mock_analyze.assert_called_once_with({'markets': []}, sentiment)
+
+    def test_async_strategy_cycle_survives_news_failure(self):
+        """Test that a failing news fetch doesn't abort the async strategy cycle"""
+        self.mock_api.get_markets.return_value = {'markets': []}
+
+        with patch.object(self.trader_instance.news_analyzer, 'get_market_relevant_news',
+                          side_effect=RuntimeError('news feed down')):
+            with patch.object(self.trader_instance, 'analyze_market', return_value=None) as mock_analyze:
+                asyncio.run(self.trader_instance.run_trading_strategy_async())
+
+        market_data, sentiment = mock_analyze.call_args.args
+        self.assertEqual(market_data, {'markets': []})
+        self.assertEqual(sentiment['overall_sentiment'], 0.0)
+        self.mock_logger.error.assert_called_once()
+
 class TestAPIEndpoints(unittest.TestCase):
     """Test API endpoints and WebSocket functionality"""
     
@@ -232,14 +347,19 @@ class TestAPIEndpoints(unittest.TestCase):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE
             )
-            # Give server time to start
-            time.sleep(3)
+            # Wait until the server answers health checks
+            if not wait_for_server(cls.server_process):
+                print("Bot interface server did not become ready")
         except Exception as e:
             print(f"Could not start server for testing: {e}")
+
+        # One keep-alive client shared by all endpoint tests
+        cls.client = httpx.Client(base_url=SERVER_URL, timeout=5.0)
     
     @classmethod
     def tearDownClass(cls):
         """Stop the bot interface server"""
+        cls.client.close()
         if cls.server_process:
             cls.server_process.terminate()
             cls.server_process.wait()
@@ -247,63 +367,79 @@ class TestAPIEndpoints(unittest.TestCase):
     def test_health_endpoint(self):
         """Test health check endpoint"""
         try:
-            response = requests.get('http://localhost:3001/health', timeout=5)
+            response = self.client.get('/health')
             self.assertEqual(response.status_code, 200)
             
             data = response.json()
             self.assertIn('status', data)
             self.assertIn('timestamp', data)
-        except requests.exceptions.RequestException:
+        except httpx.RequestError:
             self.skipTest("Bot interface server not available for testing")
     
     def test_status_endpoint(self):
         """Test status endpoint"""
         try:
-            response = requests.get('http://localhost:3001/api/status', timeout=5)
+            response = self.client.get('/api/status')
             self.assertEqual(response.status_code, 200)
             
             data = response.json()
             self.assertIn('trading', data)
             self.assertIn('lastUpdate', data)
             self.assertIn('activeStrategies', data)
-        except requests.exceptions.RequestException:
+        except httpx.RequestError:
             self.skipTest("Bot interface server not available for testing")
     
     def test_positions_endpoint(self):
         """Test positions endpoint"""
         try:
-            response = requests.get('http://localhost:3001/api/positions', timeout=5)
+            response = self.client.get('/api/positions')
             self.assertEqual(response.status_code, 200)
             
             data = response.json()
             self.assertIsInstance(data, list)
-        except requests.exceptions.RequestException:
+        except httpx.RequestError:
             self.skipTest("Bot interface server not available for testing")
     
     def test_balance_endpoint(self):
         """Test balance endpoint"""
         try:
-            response = requests.get('http://localhost:3001/api/balance', timeout=5)
+            response = self.client.get('/api/balance')
             self.assertEqual(response.status_code, 200)
             
             data = response.json()
             self.assertIn('available', data)
             self.assertIn('totalEquity', data)
-        except requests.exceptions.RequestException:
+        except httpx.RequestError:
             self.skipTest("Bot interface server not available for testing")
     
     def test_config_endpoint(self):
         """Test configuration endpoint"""
         try:
-            response = requests.get('http://localhost:3001/api/config', timeout=5)
+            response = self.client.get('/api/config')
             self.assertEqual(response.status_code, 200)
             
             data = response.json()
             self.assertIn('maxPositionSize', data)
             self.assertIn('stopLoss', data)
-        except requests.exceptions.RequestException:
+        except httpx.RequestError:
+            self.skipTest("Bot interface server not available for testing")
+
+    def test_all_endpoints_smoke(self):
+        """Test that all endpoints answer when requested concurrently"""
+        paths = ['/health', '/api/status', '/api/positions', '/api/balance', '/api/config']
+
+        async def fetch_all():
+            async with httpx.AsyncClient(base_url=SERVER_URL, timeout=5.0) as client:
+                return await asyncio.gather(*[client.get(path) for path in paths])
+
+        try:
+            responses = asyncio.run(fetch_all())
+        except httpx.RequestError:
             self.skipTest("Bot interface server not available for testing")
 
+        for path, response in zip(paths, responses):
+            self.assertEqual(response.status_code, 200, path)
+
 class TestPerformanceMetrics(unittest.TestCase):
     """Test performance monitoring and metrics"""
     
@@ -318,14 +454,20 @@ class TestPerformanceMetrics(unittest.TestCase):
         ]
         
         # Calculate basic metrics
-        total_pnl = sum(trade['pnl'] for trade in trades)
-        win_count = sum(1 for trade in trades if trade['pnl'] > 0)
-        total_trades = len(trades)
-        win_rate = (win_count / total_trades) * 100 if total_trades > 0 else 0
+        pnl = np.fromiter((trade['pnl'] for trade in trades), dtype=np.float64, count=len(trades))
+        total_pnl = pnl.sum()
+        win_rate = (pnl > 0).mean() * 100 if pnl.size > 0 else 0
+        total_trades = pnl.size
         
         self.assertEqual(total_pnl, 17)
         self.assertEqual(win_rate, 50.0)
         self.assertEqual(total_trades, 4)
+        
+        # Production metrics agree with the direct calculation
+        metrics = performance_analytics.PerformanceAnalytics.compute_pnl_metrics(pnl)
+        self.assertEqual(metrics['total_pnl'], total_pnl)
+        self.assertEqual(metrics['win_rate'] * 100, win_rate)
+        self.assertEqual(metrics['max_drawdown'], 5)
 
 def run_system_validation():
     """Run comprehensive system validation"""
@@ -388,7 +530,7 @@ def run_system_validation():
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
-        time.sleep(3)  # Give server time to start
+        wait_for_server(server_process)  # Give server time to start
         
         # Test health endpoint
         response = requests.get('http://localhost:3001/health', timeout=5)